@@ -1,12 +1,25 @@
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
+from tkinter import messagebox, scrolledtext, ttk
 import threading
+import queue
+import bisect
+from collections import deque
+from itertools import islice
 from beacon_detect import run_beacon_detection
 import os, datetime
 
 NOTIF_DIR = "notifications"
 os.makedirs(NOTIF_DIR, exist_ok = True)
 
+# GUI update dispatch: worker threads only enqueue, the Tk loop drains
+UI_TICK_MS = 50                  # how often the Tk loop drains the queue
+MAX_EVENTS_PER_TICK = 2000       # cap work per tick so the UI never stalls
+MAX_CONSOLE_LINES = 500          # lines kept in the console before trimming
+
+# Notification list view: rows are fetched in pages as the user scrolls
+NOTIF_PAGE_SIZE = 200
+FILTER_DELAY_MS = 250            # debounce for the filter box
+
 MENU_OPTIONS = [
     "Beacon Detection",
     "Historical Data Viewer",
@@ -14,6 +27,9 @@ MENU_OPTIONS = [
 ]
 
 output_console = None
+ui_queue = queue.Queue()
+console_lines = deque(maxlen=MAX_CONSOLE_LINES)
+notif_index = None               # sorted notification file names, built on first use
 root = tk.Tk()
 root.title("SARSAT GUI")
 root.geometry("600x500")
@@ -51,13 +67,62 @@ def show_main_menu():
 
     output_console = scrolledtext.ScrolledText(root, wrap=tk.WORD, height=10)
     output_console.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    # replay recent history so messages logged off-screen aren't lost
+    if console_lines:
+        output_console.insert(tk.END, "\n".join(console_lines) + "\n")
+        output_console.see(tk.END)
 
 def log_to_console(msg):
-    def safe_insert():
-        if output_console and output_console.winfo_exists():
-            output_console.insert(tk.END, msg + "\n")
-            output_console.see(tk.END)
-    root.after(0, safe_insert)
+    """
+    Thread-safe: queue `msg` for the Tk loop instead of touching widgets.
+    """
+    ui_queue.put(("log", msg))
+
+def post_detection_result(data):
+    """
+    Thread-safe: queue a detection result for the Tk loop.
+    """
+    ui_queue.put(("result", data))
+
+def append_console(msgs):
+    """
+    Insert a batch of messages with a single widget update, then trim
+    the console down to MAX_CONSOLE_LINES.
+    """
+    console_lines.extend(msgs)
+    if not (output_console and output_console.winfo_exists()):
+        return
+    output_console.insert(tk.END, "\n".join(msgs[-MAX_CONSOLE_LINES:]) + "\n")
+    # the text always ends with an empty line after the final newline
+    excess = int(output_console.index("end-1c").split(".")[0]) - 1 - MAX_CONSOLE_LINES
+    if excess > 0:
+        output_console.delete("1.0", f"{excess + 1}.0")
+    output_console.see(tk.END)
+
+def drain_ui_queue():
+    """
+    Runs on the Tk loop every UI_TICK_MS: pulls pending events, coalesces
+    log messages into one console update and detection results into one
+    batch, then reschedules itself.
+    """
+    msgs, results = [], []
+    try:
+        for _ in range(MAX_EVENTS_PER_TICK):
+            kind, payload = ui_queue.get_nowait()
+            if kind == "log":
+                msgs.append(payload)
+            elif kind == "result":
+                results.append(payload)
+    except queue.Empty:
+        pass
+
+    try:
+        if msgs:
+            append_console(msgs)
+        if results:
+            on_detection_results(results)
+    finally:
+        root.after(UI_TICK_MS, drain_ui_queue)
 
 
 def show_detecting_screen():
@@ -67,7 +132,7 @@ def show_detecting_screen():
     threading.Thread(
         target=lambda: run_beacon_detection(
             log=log_to_console,
-            callback=lambda d: root.after(0, on_detection_result, d)
+            callback=post_detection_result
         ),
         daemon=True
     ).start()
@@ -85,23 +150,39 @@ def show_result_screen(data):
     tk.Button(frame, text="Back to Menu", command=show_main_menu).pack(pady=20)
 
 
-def on_detection_result(data):
-    if not data:
-        messagebox.showerror("Error", "Failed to decode beacon.")
-        return show_main_menu()
-
-    # 1) flash as alert
-    flash_window()
-
-    # 2) save to timestamped text file
-    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+def save_notification(data):
+    """
+    Write `data` to a timestamped text file in NOTIF_DIR. Microseconds
+    keep names unique when several results arrive within one second.
+    """
+    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     fname = f"{NOTIF_DIR}/{ts}.txt"
     with open(fname, "w") as f:
         for key, val in data.items():
             f.write(f"{key}: {val}\n")
+    if notif_index is not None:
+        bisect.insort(notif_index, os.path.basename(fname))
 
-    # 3) show the results screen
-    show_result_screen(data)
+
+def on_detection_results(batch):
+    """
+    Handle every result received since the last tick at once: save each
+    decoded beacon, but flash and redraw only once for the whole batch.
+    """
+    decoded = [data for data in batch if data]
+    if not decoded:
+        messagebox.showerror("Error", "Failed to decode beacon.")
+        return show_main_menu()
+
+    # 1) save every decoded beacon to its own timestamped file
+    for data in decoded:
+        save_notification(data)
+
+    # 2) flash as alert
+    flash_window()
+
+    # 3) show the results screen for the most recent beacon
+    show_result_screen(decoded[-1])
 
 
 def show_file_browser():
@@ -109,20 +190,123 @@ def show_file_browser():
     tk.Label(root, text="Historical Data Viewer", font=("Arial", 14)).pack(pady=10)
     tk.Button(root, text="Back", command=show_main_menu).pack(pady=20)
 
+def load_notif_index():
+    """
+    Return the sorted list of notification file names. The directory is
+    scanned once; save_notification keeps the list current afterwards.
+    """
+    global notif_index
+    if notif_index is None:
+        with os.scandir(NOTIF_DIR) as entries:
+            notif_index = sorted(e.name for e in entries if e.is_file())
+    return notif_index
+
+def iter_notifications(pattern=""):
+    """
+    Lazily yield notification names newest-first, keeping only those
+    containing `pattern` (case-insensitive).
+    """
+    pattern = pattern.lower()
+    for name in reversed(load_notif_index()):
+        if pattern in name.lower():
+            yield name
+
+def open_notification(name):
+    """
+    Read a single notification from disk and show it in its own window.
+    """
+    try:
+        with open(os.path.join(NOTIF_DIR, name)) as f:
+            text = f.read()
+    except OSError as e:
+        messagebox.showerror("Error", f"Could not open {name}: {e}")
+        return
+
+    win = tk.Toplevel(root)
+    win.title(name)
+    view = scrolledtext.ScrolledText(win, wrap=tk.WORD, height=12, width=60)
+    view.insert(tk.END, text)
+    view.config(state=tk.DISABLED)
+    view.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    tk.Button(win, text="Close", command=win.destroy).pack(pady=5)
+
 def show_notification_screen():
     clear_screen()
     tk.Label(root, text="Notifications and Alerts", font=("Arial", 14)).pack(pady=10)
 
-    # List files sorted newest-first
-    files = sorted(os.listdir(NOTIF_DIR), reverse=True)
-    if not files:
-        tk.Label(root, text="(no notifications yet)", font=("Arial", 12)).pack(pady=5)
-    else:
-        for fname in files:
-            tk.Label(root, text=fname, font=("Arial", 12)).pack(anchor="w", padx=20)
+    filter_var = tk.StringVar()
+    filter_row = tk.Frame(root)
+    filter_row.pack(fill="x", padx=10)
+    tk.Label(filter_row, text="Filter:").pack(side="left")
+    filter_entry = tk.Entry(filter_row, textvariable=filter_var)
+    filter_entry.pack(side="left", fill="x", expand=True)
+
+    list_frame = tk.Frame(root)
+    list_frame.pack(fill="both", expand=True, padx=10, pady=5)
+    tree = ttk.Treeview(list_frame, show="tree", selectmode="browse")
+    scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(side="left", fill="both", expand=True)
+
+    status = tk.Label(root, text="", font=("Arial", 10))
+    status.pack()
+
+    # rows are inserted a page at a time, only as the user scrolls to them
+    state = {"rows": None, "exhausted": False, "pending": None, "loading": False}
+
+    def load_page():
+        state["loading"] = False
+        if state["exhausted"]:
+            return
+        page = list(islice(state["rows"], NOTIF_PAGE_SIZE))
+        for name in page:
+            tree.insert("", tk.END, iid=name, text=name)
+        if len(page) < NOTIF_PAGE_SIZE:
+            state["exhausted"] = True
+        shown = len(tree.get_children())
+        if shown == 0:
+            status.config(text="(no notifications yet)" if not filter_var.get()
+                          else "(no matching notifications)")
+        else:
+            status.config(text=f"{shown} shown" + ("" if state["exhausted"] else "+"))
+
+    def reload():
+        state["pending"] = None
+        tree.delete(*tree.get_children())
+        state["rows"] = iter_notifications(filter_var.get())
+        state["exhausted"] = False
+        load_page()
+
+    def on_scroll(first, last):
+        scrollbar.set(first, last)
+        # fetch the next page once the view nears the end of what's loaded
+        if float(last) > 0.9 and not (state["exhausted"] or state["loading"]):
+            state["loading"] = True
+            root.after_idle(load_page)
+
+    def on_filter_change(*_):
+        if state["pending"]:
+            root.after_cancel(state["pending"])
+        state["pending"] = root.after(FILTER_DELAY_MS, reload)
+
+    def on_open(_event=None):
+        selection = tree.selection()
+        if selection:
+            open_notification(selection[0])
+
+    tree.configure(yscrollcommand=on_scroll)
+    tree.bind("<Double-1>", on_open)
+    tree.bind("<Return>", on_open)
+    filter_entry.bind("<KeyRelease>", on_filter_change)
+
+    def go_back():
+        if state["pending"]:
+            root.after_cancel(state["pending"])
+        show_main_menu()
+
+    tk.Button(root, text="Back", command=go_back).pack(pady=10)
+    reload()
 
-    tk.Button(root, text="Back", command=show_main_menu).pack(pady=20)
-    
 def menu_action(index):
     if index == 0:
         show_detecting_screen()
@@ -132,4 +316,5 @@ def menu_action(index):
         show_notification_screen()
 
 show_main_menu()
+root.after(UI_TICK_MS, drain_ui_queue)
 root.mainloop()